@@ -3,66 +3,153 @@ Generate graph visualization data from Codie's entity memory.
 
 Main orchestration script that:
 1. Discovers all entity files
-2. Parses each entity
+2. Parses each entity (reusing cached results for files unchanged since the last run)
 3. Extracts cross-references
 4. Generates JSON output
 
 Run: python scripts/generate_graph_data.py
 """
 
+import hashlib
 import json
+import os
+import time
 from pathlib import Path
 
-from models import GraphData
-from parse_entities import discover_entity_files, parse_entity_file, extract_cross_references
+from pydantic_core import to_json
 
+from models import EntityNode, GraphData
+from parse_entities import discover_entity_files, scan_entity_content, parse_entity_file, extract_cross_references
 
-def main():
-    """Generate graph data JSON from entity memory."""
+# Modules whose code determines parsed output; any edit to them invalidates the index
+SCRIPTS_DIR = Path(__file__).parent
+INDEX_SOURCES = ("parse_entities.py", "models.py", "generate_graph_data.py")
+
+
+def index_version() -> str:
+    """Hash of the parsing source code, so cached entities never outlive the code that produced them."""
+    digest = hashlib.sha256()
+    for source in INDEX_SOURCES:
+        digest.update((SCRIPTS_DIR / source).read_bytes())
+    return digest.hexdigest()
+
+
+INDEX_VERSION = index_version()
+
+# Files modified this close to the start of a run are not cached: on filesystems with
+# coarse timestamps a later edit in the same tick would keep the same mtime (git's racy-entry rule)
+RACY_WINDOW_NS = 1_000_000_000
+
+
+def load_index(index_path: Path) -> dict[str, tuple[int, int, EntityNode, set[str]]]:
+    """
+    Load the per-entity parse index written by the previous run.
+
+    The index is a rebuildable cache: a missing, unreadable, truncated or
+    malformed file is treated like an index from another version and ignored.
+
+    Args:
+        index_path: Path to the index JSON file
+
+    Returns:
+        Mapping of entity ID to (mtime_ns, size, node, referenced entity IDs);
+        empty if there is no usable index for this version
+    """
+    try:
+        index = json.loads(index_path.read_bytes())
+        if index["version"] != INDEX_VERSION:
+            return {}
+
+        return {
+            entity_id: (
+                entry["mtime_ns"],
+                entry["size"],
+                EntityNode.model_validate(entry["node"]),
+                set(entry["references"]),
+            )
+            for entity_id, entry in index["entities"].items()
+        }
+    except (OSError, ValueError, TypeError, KeyError, AttributeError):
+        # OSError covers a missing/unreadable file or a directory in its place;
+        # JSONDecodeError and pydantic ValidationError are both ValueErrors
+        return {}
+
+
+def main(entity_files: list[tuple[Path, str, str, int, int]] | None = None) -> tuple[int, int]:
+    """
+    Generate graph data JSON from entity memory.
+
+    Args:
+        entity_files: Result of discover_entity_files, if the caller already
+            has it (e.g. the server's freshness check); discovered here otherwise
+
+    Returns:
+        Tuple of (node count, edge count) written to the output file
+    """
+
+    run_start_ns = time.time_ns()
 
     # Memory root directory (relative to project root via symlink)
     project_root = Path(__file__).parent.parent
     memory_root = project_root / "memory"
 
-    # Output path
+    # Output paths
     output_path = project_root / "data" / "entities.json"
+    index_path = project_root / "data" / "_index.json"
 
     print(f"Parsing entities from: {memory_root}")
 
     # Step 1: Discover all entity files
-    entity_files = discover_entity_files(memory_root)
+    if entity_files is None:
+        entity_files = discover_entity_files(memory_root)
     print(f"Found {len(entity_files)} entity files")
 
-    # Step 2: Parse all entities
+    # Step 2: Parse all entities, only re-reading files modified since the last run
+    previous_index = load_index(index_path)
+    index = {}
     nodes = []
-    for entity_file in entity_files:
+    references = {}
+    reparsed = 0
+    for entity_file, entity_id, entity_type, mtime_ns, size in entity_files:
         try:
-            node = parse_entity_file(entity_file, memory_root)
+            cached = previous_index.get(entity_id)
+            if cached and cached[:2] == (mtime_ns, size) and cached[2].path == str(entity_file):
+                _, _, node, referenced_ids = cached
+            else:
+                first_line, sections, referenced_ids = scan_entity_content(entity_file.read_text(encoding="utf-8"))
+                node = parse_entity_file(entity_file, entity_id, entity_type, first_line, sections)
+                reparsed += 1
             nodes.append(node)
+            references[entity_id] = referenced_ids
+            # Recently modified files are re-parsed next run rather than trusted by mtime
+            if mtime_ns < run_start_ns - RACY_WINDOW_NS:
+                index[entity_id] = {
+                    "mtime_ns": mtime_ns,
+                    "size": size,
+                    "node": node,
+                    "references": sorted(referenced_ids),
+                }
         except Exception as e:
             # Fail-fast: Let errors surface rather than silently skipping
             print(f"Error parsing {entity_file}: {e}")
             raise
 
-    print(f"Parsed {len(nodes)} entities")
+    print(f"Parsed {len(nodes)} entities ({reparsed} re-parsed, {len(nodes) - reparsed} unchanged)")
 
     # Filter: Keep only Izzy from people entities
     nodes = [node for node in nodes if not (node.type == "people" and node.id != "people/izzy")]
     print(f"After filtering: {len(nodes)} entities (removed non-Izzy people)")
 
     # Create entity ID set for cross-reference validation
-    entity_ids = {node.id for node in nodes}
+    entity_ids = frozenset(node.id for node in nodes)
 
     # Step 3: Extract cross-references
+    # Edges are always rebuilt from the references so added/removed entities are picked up
     edges = []
-    for entity_file in entity_files:
+    for entity_file, entity_id, *_ in entity_files:
         try:
-            # Get corresponding node for this file
-            relative_path = entity_file.relative_to(memory_root)
-            entity_id = str(relative_path.with_suffix(""))
-
             # Extract edges
-            entity_edges = extract_cross_references(entity_file, entity_id, entity_ids)
+            entity_edges = extract_cross_references(references[entity_id], entity_id, entity_ids)
             edges.extend(entity_edges)
         except Exception as e:
             print(f"Error extracting references from {entity_file}: {e}")
@@ -75,12 +162,19 @@ def main():
 
     # Step 5: Write JSON output
     output_path.parent.mkdir(parents=True, exist_ok=True)
-    output_path.write_text(graph_data.model_dump_json(indent=2))
+    # Serialize straight to UTF-8 bytes (same output as model_dump_json, no str round-trip)
+    output_path.write_bytes(to_json(graph_data, indent=2))
+    # Write the index atomically so a crash or overlapping run never leaves a truncated file
+    index_tmp_path = index_path.with_name(f"{index_path.name}.{os.getpid()}.tmp")
+    index_tmp_path.write_bytes(to_json({"version": INDEX_VERSION, "entities": index}))
+    os.replace(index_tmp_path, index_path)
 
     print(f"✓ Graph data written to: {output_path}")
     print(f"  Nodes: {len(nodes)}")
     print(f"  Edges: {len(edges)}")
 
+    return len(nodes), len(edges)
+
 
 if __name__ == "__main__":
     main()
@@ -6,6 +6,16 @@ No Dict[str, Any] - all types explicitly defined.
 
 from pydantic import BaseModel, Field
 
+# Node colors by entity type
+_COLOR_MAP = {
+    "people": "#4A90E2",      # blue
+    "projects": "#7ED321",    # green
+    "concepts": "#9013FE",    # purple
+    "patterns": "#F5A623",    # orange
+    "protocols": "#F8E71C",   # yellow
+    "organizations": "#D0021B" # red
+}
+
 
 class ConceptSummary(BaseModel):
     """Structured summary for concept entities."""
@@ -28,15 +38,7 @@ class EntityNode(BaseModel):
 
     def get_color(self) -> str:
         """Returns color code based on entity type."""
-        color_map = {
-            "people": "#4A90E2",      # blue
-            "projects": "#7ED321",    # green
-            "concepts": "#9013FE",    # purple
-            "patterns": "#F5A623",    # orange
-            "protocols": "#F8E71C",   # yellow
-            "organizations": "#D0021B" # red
-        }
-        return color_map.get(self.type, "#CCCCCC")
+        return _COLOR_MAP.get(self.type, "#CCCCCC")
 
 
 class EntityEdge(BaseModel):
@@ -4,13 +4,70 @@ Parse entity files from Codie's memory directory.
 Clean, focused implementation following fail-fast principles.
 """
 
+import os
 import re
 from pathlib import Path
 
 from models import EntityNode, EntityEdge, ConceptSummary
 
+ENTITY_TYPES = ("people", "projects", "concepts", "patterns", "protocols", "organizations", "anti-patterns", "skills")
 
-def extract_concept_summary(content: str, entity_type: str = "concepts") -> ConceptSummary:
+# Pattern to match entity references (e.g., "concepts/archaeological_engineering")
+# Matches: word/word-or-underscore pattern
+# Use non-capturing group (?:...) so findall returns full match, not just the group
+_REF_RE = re.compile(r'\b(?:people|projects|concepts|patterns|protocols|organizations|anti-patterns|skills)/[\w-]+\b')
+
+# First non-empty line: starts at the first non-whitespace character, runs to end of line
+_FIRST_LINE_RE = re.compile(r'\S.*')
+
+# Section headers (## Header lines) and entity references in a single scan
+_SCAN_RE = re.compile(rf'(?m)^## (?P<header>.*)$|(?P<ref>{_REF_RE.pattern})')
+
+
+def scan_entity_content(content: str) -> tuple[str, dict[str, str], set[str]]:
+    """
+    Scan entity markdown content once for everything the graph needs.
+
+    One regex pass finds both ## section headers and entity references;
+    section bodies are sliced out of the content between headers.
+
+    Args:
+        content: Full markdown content of entity file
+
+    Returns:
+        Tuple of (first non-empty line, sections keyed by lowercased header, referenced entity IDs)
+    """
+    # First non-empty line as potential title (markdown heading)
+    first_line_match = _FIRST_LINE_RE.search(content)
+    first_line = first_line_match.group().strip() if first_line_match else ""
+
+    sections = {}
+    referenced_ids = set()
+    current_header = None
+    section_start = 0
+
+    for match in _SCAN_RE.finditer(content):
+        if match["ref"]:
+            referenced_ids.add(match["ref"])
+            continue
+
+        # Save previous section if it exists
+        if current_header:
+            sections[current_header.lower()] = content[section_start:match.start()].strip()
+        # Start new section
+        current_header = match["header"].strip()
+        section_start = match.end()
+        # Header line is consumed by the match, so pick up any references in it here
+        referenced_ids.update(_REF_RE.findall(match["header"]))
+
+    # Save last section
+    if current_header:
+        sections[current_header.lower()] = content[section_start:].strip()
+
+    return first_line, sections, referenced_ids
+
+
+def extract_concept_summary(sections: dict[str, str], entity_type: str = "concepts") -> ConceptSummary:
     """
     Extract structured summary from entity markdown file.
 
@@ -45,33 +102,12 @@ def extract_concept_summary(content: str, entity_type: str = "concepts") -> Conc
     - Key Projects → origin_story
 
     Args:
-        content: Full markdown content of entity file
+        sections: Section content keyed by lowercased ## header
         entity_type: Type of entity (concepts, patterns, protocols, etc.)
 
     Returns:
         ConceptSummary with extracted sections
     """
-    # Split content into sections based on ## headers
-    sections = {}
-    current_header = None
-    current_content = []
-
-    for line in content.split("\n"):
-        # Check if this is a section header (## Header)
-        if line.startswith("## "):
-            # Save previous section if it exists
-            if current_header:
-                sections[current_header.lower()] = "\n".join(current_content).strip()
-            # Start new section
-            current_header = line[3:].strip()
-            current_content = []
-        elif current_header:
-            current_content.append(line)
-
-    # Save last section
-    if current_header:
-        sections[current_header.lower()] = "\n".join(current_content).strip()
-
     # Map sections to summary fields using flexible matching
     def find_section(*keywords):
         """Find first section matching any of the keywords."""
@@ -112,7 +148,7 @@ def extract_concept_summary(content: str, entity_type: str = "concepts") -> Conc
         origin_story = find_section("source", "validation", "history", "background")
         philosophy = find_section("meta-cognitive", "integration", "philosophy", "future applications")
 
-    return ConceptSummary(
+    return ConceptSummary.model_construct(
         core_idea=core_idea,
         common_patterns=common_patterns,
         warning_signs=warning_signs,
@@ -121,39 +157,33 @@ def extract_concept_summary(content: str, entity_type: str = "concepts") -> Conc
     )
 
 
-def parse_entity_file(file_path: Path, memory_root: Path) -> EntityNode:
+def parse_entity_file(
+    file_path: Path, entity_id: str, entity_type: str, first_line: str, sections: dict[str, str]
+) -> EntityNode:
     """
     Parse a single entity markdown file and extract metadata.
 
     Args:
         file_path: Path to the entity markdown file
-        memory_root: Root memory directory path
+        entity_id: Entity identifier (e.g., "concepts/archaeological_engineering")
+        entity_type: Entity type directory (e.g., "concepts")
+        first_line: First non-empty line of the file (see scan_entity_content)
+        sections: Section content keyed by lowercased ## header
 
     Returns:
         EntityNode with extracted metadata
     """
-    # Calculate relative path from memory root (e.g., "concepts/archaeological_engineering.md")
-    relative_path = file_path.relative_to(memory_root)
-
-    # Extract entity type from directory (e.g., "concepts", "patterns")
-    entity_type = relative_path.parts[0] if len(relative_path.parts) > 1 else "root"
-
-    # Create entity ID by removing .md extension
-    entity_id = str(relative_path.with_suffix(""))
-
     # Extract label from filename (e.g., "archaeological_engineering" -> "Archaeological Engineering")
-    label = relative_path.stem.replace("_", " ").replace("-", " ").title()
+    label = entity_id.partition("/")[2].replace("_", " ").replace("-", " ").title()
 
-    # Read first non-empty line as potential title (markdown heading)
-    content = file_path.read_text()
-    first_line = next((line.strip() for line in content.split("\n") if line.strip()), "")
+    # First non-empty line is the potential title (markdown heading)
     if first_line.startswith("#"):
         # Use markdown heading as label
         label = first_line.lstrip("#").strip()
 
     # Special handling for people/izzy entity
     if entity_id == "people/izzy":
-        summary = ConceptSummary(
+        summary = ConceptSummary.model_construct(
             core_idea="Lead Engineer at FasterOutcomes. Prefers simple solutions over complex ones, with strong emphasis on proportional response (solution complexity < problem complexity), evidence-based decisions, and industry-standard patterns. Direct and technical communication style with patient correction approach.",
             common_patterns="Consistently steers toward simpler implementations; catches over-engineering and requests simplification; values TDD discipline (write failing test first, then minimal code to pass); applies Archaeological Engineering approach (investigate existing solutions first); engages in collaborative design discussions exploring trade-offs; appreciates cleanup and self-correction.",
             warning_signs="Avoid: defensive code 'just in case'; setup/automation scripts for simple tasks; complex solutions when simple ones work; scope creep beyond project boundaries; speculative code without test coverage; force push to repositories.",
@@ -162,9 +192,10 @@ def parse_entity_file(file_path: Path, memory_root: Path) -> EntityNode:
         )
     else:
         # Extract summary for all other entity types (passing entity_type for type-specific extraction)
-        summary = extract_concept_summary(content, entity_type)
+        summary = extract_concept_summary(sections, entity_type)
 
-    return EntityNode(
+    # All fields are computed here from trusted input, so skip re-validation
+    return EntityNode.model_construct(
         id=entity_id,
         label=label,
         type=entity_type,
@@ -173,9 +204,9 @@ def parse_entity_file(file_path: Path, memory_root: Path) -> EntityNode:
     )
 
 
-def extract_cross_references(file_path: Path, entity_id: str, all_entity_ids: set[str]) -> list[EntityEdge]:
+def extract_cross_references(referenced_ids: set[str], entity_id: str, all_entity_ids: frozenset[str]) -> list[EntityEdge]:
     """
-    Extract cross-references from entity file content.
+    Build edges for the cross-references found in an entity file.
 
     Looks for references to other entities in the format:
     - concepts/some-concept
@@ -183,52 +214,50 @@ def extract_cross_references(file_path: Path, entity_id: str, all_entity_ids: se
     - projects/some-project
 
     Args:
-        file_path: Path to the entity file
+        referenced_ids: Entity references found in the file (see scan_entity_content)
         entity_id: ID of the current entity
         all_entity_ids: Set of all valid entity IDs to match against
 
     Returns:
         List of EntityEdge objects representing relationships
     """
-    content = file_path.read_text()
-    edges = []
+    # Only create edges for valid entity IDs that actually exist (set intersection runs in C)
+    valid_ids = referenced_ids & all_entity_ids
+    valid_ids.discard(entity_id)
 
-    # Pattern to match entity references (e.g., "concepts/archaeological_engineering")
-    # Matches: word/word-or-underscore pattern
-    # Use non-capturing group (?:...) so re.findall returns full match, not just the group
-    pattern = r'\b(?:people|projects|concepts|patterns|protocols|organizations|anti-patterns|skills)/[\w-]+\b'
+    return [EntityEdge.model_construct(from_id=entity_id, to_id=ref_id) for ref_id in valid_ids]
 
-    matches = re.findall(pattern, content)
-    referenced_ids = set(matches)
 
-    # Only create edges for valid entity IDs that actually exist
-    for ref_id in referenced_ids:
-        if ref_id in all_entity_ids and ref_id != entity_id:
-            edges.append(EntityEdge(
-                from_id=entity_id,
-                to_id=ref_id
-            ))
-
-    return edges
-
-
-def discover_entity_files(memory_root: Path) -> list[Path]:
+def discover_entity_files(memory_root: Path) -> list[tuple[Path, str, str, int, int]]:
     """
     Discover all entity markdown files in memory directory.
 
+    Entity ID, type, modification time and size are derived here from the
+    directory being scanned, so later steps don't need to recompute them
+    from the path or stat the file again.
+
     Args:
         memory_root: Root memory directory path
 
     Returns:
-        List of paths to entity markdown files
+        List of (file path, entity ID, entity type, mtime_ns, size) tuples,
+        e.g. (Path(".../concepts/foo.md"), "concepts/foo", "concepts", 1734567890123456789, 2048)
     """
-    entity_types = ["people", "projects", "concepts", "patterns", "protocols", "organizations", "anti-patterns", "skills"]
     entity_files = []
 
-    for entity_type in entity_types:
+    for entity_type in ENTITY_TYPES:
         type_dir = memory_root / entity_type
-        if type_dir.exists():
-            # Find all .md files in this entity type directory
-            entity_files.extend(type_dir.glob("*.md"))
+        try:
+            # Find all .md files in this entity type directory (scandir avoids a stat per entry)
+            with os.scandir(type_dir) as entries:
+                for entry in entries:
+                    if entry.name.endswith(".md") and entry.is_file():
+                        # Entity ID is the path relative to memory root without .md
+                        entity_id = f"{entity_type}/{entry.name[:-3]}"
+                        stat = entry.stat()
+                        entity_files.append((Path(entry.path), entity_id, entity_type, stat.st_mtime_ns, stat.st_size))
+        except FileNotFoundError:
+            # Entity type directory not present in this memory
+            continue
 
     return entity_files
@@ -4,7 +4,8 @@ Simple Flask server for memory visualization.
 Serves static files and provides endpoint to regenerate graph data.
 """
 
-import subprocess
+import sys
+import threading
 from pathlib import Path
 
 from flask import Flask, jsonify, send_from_directory
@@ -16,6 +17,33 @@ PROJECT_ROOT = Path(__file__).parent
 PUBLIC_DIR = PROJECT_ROOT / "public"
 DATA_DIR = PROJECT_ROOT / "data"
 SCRIPTS_DIR = PROJECT_ROOT / "scripts"
+MEMORY_DIR = PROJECT_ROOT / "memory"
+OUTPUT_PATH = DATA_DIR / "entities.json"
+
+# Scripts use flat imports (from models import ...), so expose them directly
+sys.path.insert(0, str(SCRIPTS_DIR))
+
+from generate_graph_data import main as generate_graph_data  # noqa: E402
+from parse_entities import discover_entity_files  # noqa: E402
+
+# Only one regeneration may write entities.json at a time
+regenerate_lock = threading.Lock()
+
+# Key (memory snapshot, output mtime) and node/edge counts of the last regeneration
+last_regeneration = {"key": None, "counts": None}
+
+
+def memory_snapshot(entity_files: list[tuple[Path, str, str, int, int]]) -> tuple[tuple[str, int, int], ...]:
+    """Fingerprint of the entity memory: (entity ID, mtime, size) for every discovered entity file."""
+    return tuple(sorted((entity_id, mtime_ns, size) for _, entity_id, _, mtime_ns, size in entity_files))
+
+
+def output_mtime() -> int | None:
+    """Modification time of entities.json, or None if it does not exist."""
+    try:
+        return OUTPUT_PATH.stat().st_mtime_ns
+    except FileNotFoundError:
+        return None
 
 
 @app.route("/")
@@ -39,30 +67,26 @@ def serve_data(path):
 @app.route("/api/regenerate", methods=["POST"])
 def regenerate():
     """
-    Regenerate graph data by running the generation script.
+    Regenerate graph data by running the generation script in-process.
 
     Returns:
         JSON response with success status and node/edge counts
     """
     try:
-        # Run the generation script
-        result = subprocess.run(
-            ["python", str(SCRIPTS_DIR / "generate_graph_data.py")],
-            capture_output=True,
-            text=True,
-            check=True,
-            cwd=PROJECT_ROOT
-        )
-
-        # Parse output to extract node/edge counts
-        output = result.stdout
-        nodes = 0
-        edges = 0
-        for line in output.split("\n"):
-            if "Nodes:" in line:
-                nodes = int(line.split("Nodes:")[1].strip())
-            elif "Edges:" in line:
-                edges = int(line.split("Edges:")[1].strip())
+        with regenerate_lock:
+            # One discovery pass (with mtimes and sizes) serves both the fingerprint and the generator
+            entity_files = discover_entity_files(MEMORY_DIR)
+            snapshot = memory_snapshot(entity_files)
+
+            # Reuse the last result only if neither the memory nor the output file changed
+            # since the last regeneration (entities.json is tracked in git, so checkout/pull can replace it)
+            if last_regeneration["key"] == (snapshot, output_mtime()):
+                nodes, edges = last_regeneration["counts"]
+            else:
+                nodes, edges = generate_graph_data(entity_files)
+                # Key on the output just written so the next identical request is a hit
+                last_regeneration["key"] = (snapshot, output_mtime())
+                last_regeneration["counts"] = (nodes, edges)
 
         return jsonify({
             "success": True,
@@ -71,12 +95,6 @@ def regenerate():
             "message": "Graph data regenerated successfully"
         })
 
-    except subprocess.CalledProcessError as e:
-        return jsonify({
-            "success": False,
-            "error": f"Script failed: {e.stderr}"
-        }), 500
-
     except Exception as e:
         return jsonify({
             "success": False,